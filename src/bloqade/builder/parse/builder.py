@@ -2,7 +2,7 @@ from bloqade.builder.base import Builder
 from bloqade.builder.coupling import LevelCoupling, Rydberg, Hyperfine
 from bloqade.builder.sequence_builder import SequenceBuilder
 from bloqade.builder.field import Field, Detuning, RabiAmplitude, RabiPhase
-from bloqade.builder.spatial import SpatialModulation, Location, Uniform, Scale
+from bloqade.builder.spatial import Location, Uniform, Scale
 from bloqade.builder.waveform import WaveformPrimitive, Slice, Record, Sample, Fn
 from bloqade.builder.assign import Assign, BatchAssign, ListAssign
 from bloqade.builder.args import Args
@@ -10,6 +10,8 @@ from bloqade.builder.parallelize import Parallelize
 from bloqade.builder.parse.stream import BuilderNode, BuilderStream
 import bloqade.ir as ir
 from beartype.typing import TYPE_CHECKING, Tuple, Union, Dict, List, Optional, Set
+from collections import Counter
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
     from bloqade.ir.routine.params import ParamType
@@ -17,14 +19,41 @@ if TYPE_CHECKING:
     from bloqade.ir.analog_circuit import AnalogCircuit
 
 
+# results of previous parses keyed by the builder object, builder chains are not
+# modified once built so the same builder always parses to the same result.
+_REGISTER_CACHE: "WeakKeyDictionary[Builder, ir.AtomArrangement]" = WeakKeyDictionary()
+_SEQUENCE_CACHE: "WeakKeyDictionary[Builder, ir.Sequence]" = WeakKeyDictionary()
+_PRAGMA_CACHE: "WeakKeyDictionary[Builder, Tuple]" = WeakKeyDictionary()
+
+_SPATIAL_TYPES = (Location, Uniform, Scale)
+_FIELD_TYPES = (Detuning, RabiAmplitude, RabiPhase)
+_RABI_TYPES = (RabiAmplitude, RabiPhase)
+_COUPLING_TYPES = (Rydberg, Hyperfine)
+
+
 class Parser:
-    stream: Optional["BuilderStream"] = None
-    vector_node_names: Set[str] = set()
-    sequence: ir.Sequence = ir.Sequence()
-    register: Union[ir.AtomArrangement, ir.ParallelRegister, None] = None
-    batch_params: List[Dict[str, "ParamType"]] = [{}]
-    static_params: Dict[str, "ParamType"] = {}
-    order: Tuple[str, ...] = ()
+    __slots__ = (
+        "stream",
+        "vector_node_names",
+        "sequence",
+        "register",
+        "batch_params",
+        "static_params",
+        "order",
+        "coupling_name",
+        "field_name",
+    )
+
+    def __init__(self) -> None:
+        self.stream: Optional["BuilderStream"] = None
+        self.vector_node_names: Set[str] = set()
+        self.sequence: ir.Sequence = ir.Sequence()
+        self.register: Union[ir.AtomArrangement, ir.ParallelRegister, None] = None
+        self.batch_params: List[Dict[str, "ParamType"]] = [{}]
+        self.static_params: Dict[str, "ParamType"] = {}
+        self.order: Tuple[str, ...] = ()
+        self.coupling_name: Optional[ir.LevelCoupling] = None
+        self.field_name: Optional[ir.FieldName] = None
 
     def reset(self, builder: Builder):
         self.stream = BuilderStream.create(builder)
@@ -34,38 +63,37 @@ class Parser:
         self.batch_params = [{}]
         self.static_params = {}
         self.order = ()
+        self.coupling_name = None
+        self.field_name = None
 
     def read_address(self, stream) -> Tuple[LevelCoupling, Field, BuilderNode]:
-        spatial = stream.read_next([Location, Uniform, Scale])
-        curr = spatial
+        spatial = stream.read_next(_SPATIAL_TYPES)
 
-        if curr is None:
+        if spatial is None:
             return (None, None, None)
 
-        while curr.next is not None:
-            if not isinstance(curr.node, SpatialModulation):
-                break
-            curr = curr.next
-
-        if type(spatial.node.__parent__) in [Detuning, RabiAmplitude, RabiPhase]:
+        if isinstance(spatial.node.__parent__, _FIELD_TYPES):
             field = spatial.node.__parent__  # field is updated
-            if type(field) in [RabiAmplitude, RabiPhase]:
+            if isinstance(field, _RABI_TYPES):
                 coupling = field.__parent__.__parent__  # skip Rabi
             else:
                 coupling = field.__parent__
 
             # coupling not updated
-            if type(coupling) not in [Rydberg, Hyperfine]:
+            if not isinstance(coupling, _COUPLING_TYPES):
                 coupling = None
             return (coupling, field, spatial)
         else:  # only spatial is updated
             return (None, None, spatial)
 
-    def read_waveform(self, head: BuilderNode) -> Tuple[ir.Waveform, BuilderNode]:
-        curr = head
+    def read_waveform(self, stream: BuilderStream) -> ir.Waveform:
+        # scan the waveform nodes by index starting at the stream position,
+        # the stream is left at the first node that is not part of the waveform.
+        nodes = stream.nodes
+        index = stream.index
         waveform = None
-        while curr is not None:
-            node = curr.node
+        while index < len(nodes):
+            node = nodes[index].node
 
             if isinstance(node, Slice):
                 waveform = waveform[node._start : node._stop]
@@ -86,8 +114,8 @@ class Parser:
                     waveform = waveform.append(sample_waveform)
             elif (
                 isinstance(node, Fn)
-                and curr.next is not None
-                and isinstance(curr.next.node, Sample)
+                and index + 1 < len(nodes)
+                and isinstance(nodes[index + 1].node, Sample)
             ):
                 pass
             elif isinstance(node, WaveformPrimitive):
@@ -98,21 +126,24 @@ class Parser:
             else:
                 break
 
-            curr = curr.next
+            index += 1
 
-        return waveform, curr
+        stream.index = index
+        return waveform
 
-    def read_drive(self, head) -> ir.Field:
+    def read_drive(self, head: BuilderNode, stream: BuilderStream) -> ir.Field:
         if head is None:
             return ir.Field({})
 
         sm = head.node.__bloqade_ir__()
-        wf, _ = self.read_waveform(head.next)
+        wf = self.read_waveform(stream)
 
         return ir.Field({sm: wf})
 
     def read_sequence(self) -> ir.Sequence:
-        if isinstance(self.stream.curr.node, SequenceBuilder):
+        # the stream is exhausted after the register for a bare atom arrangement
+        curr = self.stream.curr
+        if curr is not None and isinstance(curr.node, SequenceBuilder):
             # case with sequence builder object.
             self.sequence = self.stream.read().node._sequence
             return self.sequence
@@ -132,14 +163,17 @@ class Parser:
             if spatial_head is None:
                 break
 
-            pulse = self.sequence.pulses.get(self.coupling_name, ir.Pulse({}))
-            field = pulse.fields.get(self.field_name, ir.Field({}))
+            # only allocate empty pulses/fields on the first drive for them
+            pulse = self.sequence.pulses.get(self.coupling_name)
+            if pulse is None:
+                pulse = self.sequence.pulses[self.coupling_name] = ir.Pulse({})
 
-            drive = self.read_drive(spatial_head)
-            field = field.add(drive)
+            field = pulse.fields.get(self.field_name)
+            if field is None:
+                field = ir.Field({})
 
-            pulse.fields[self.field_name] = field
-            self.sequence.pulses[self.coupling_name] = pulse
+            drive = self.read_drive(spatial_head, stream)
+            pulse.fields[self.field_name] = field.add(drive)
 
         return self.sequence
 
@@ -161,9 +195,12 @@ class Parser:
 
         stream = self.stream.copy()
         curr = stream.read_next(pragma_types)
+        if curr is None:
+            return
 
-        while curr is not None:
-            node = curr.node
+        nodes = stream.nodes
+        for index in range(stream.index - 1, len(nodes)):
+            node = nodes[index].node
 
             if isinstance(node, Assign):
                 self.static_params = dict(node._static_params)
@@ -172,18 +209,12 @@ class Parser:
             elif isinstance(node, Args):
                 order = node._order
 
-                seen = set()
-                dup = []
-                for x in order:
-                    if x not in seen:
-                        seen.add(x)
-                    else:
-                        dup.append(x)
+                dup = [name for name, count in Counter(order).items() if count > 1]
 
                 if dup:
                     raise ValueError(f"Cannot have duplicate names {dup}.")
 
-                order_names = set([*order])
+                order_names = set(order)
                 vector_names = order_names.intersection(self.vector_node_names)
 
                 if vector_names:
@@ -200,27 +231,74 @@ class Parser:
             else:
                 break
 
-            curr = curr.next
+    def read_cached(
+        self, builder: Builder, sequence: bool = False, pragmas: bool = False
+    ) -> None:
+        """Read the register and, if requested, the sequence and pragmas of
+        `builder`, reusing the results from previous parses of the same builder.
+        """
+        # the register is the builder itself for a bare atom arrangement, such a
+        # builder is not hashable and caching it would keep the key alive.
+        cache = builder.__parent__ is not None
+
+        cached_sequence = _SEQUENCE_CACHE.get(builder) if cache and sequence else None
+        cached_pragmas = _PRAGMA_CACHE.get(builder) if cache and pragmas else None
+
+        if (
+            cache
+            and builder in _REGISTER_CACHE
+            and (not sequence or cached_sequence is not None)
+            and (not pragmas or cached_pragmas is not None)
+        ):
+            self.register = _REGISTER_CACHE[builder]
+        else:
+            self.reset(builder)
+            self.read_register()
+
+        if sequence:
+            if cached_sequence is None:
+                self.read_sequence()
+            else:
+                self.sequence = cached_sequence
+
+        if cache:
+            _REGISTER_CACHE[builder] = self.register
+            if sequence:
+                _SEQUENCE_CACHE[builder] = self.sequence
+
+        if pragmas:
+            if cached_pragmas is None:
+                self.read_pragmas()
+                cached_pragmas = (
+                    self.register,
+                    self.static_params,
+                    self.batch_params,
+                    self.order,
+                )
+                if cache:
+                    _PRAGMA_CACHE[builder] = cached_pragmas
+
+            (
+                self.register,
+                self.static_params,
+                self.batch_params,
+                self.order,
+            ) = cached_pragmas
 
     def parse_register(
         self, builder: Builder
     ) -> Union[ir.AtomArrangement, ir.ParallelRegister]:
-        self.reset(builder)
-        self.read_register()
-        self.read_pragmas()
+        self.read_cached(builder, pragmas=True)
         return self.register
 
     def parse_sequence(self, builder: Builder) -> ir.Sequence:
-        self.reset(builder)
-        self.read_sequence()
+        self.read_cached(builder, sequence=True)
         return self.sequence
 
     def parse_circuit(self, builder: Builder) -> "AnalogCircuit":
         from bloqade.ir.analog_circuit import AnalogCircuit
 
-        self.reset(builder)
-        self.read_register()
-        self.read_sequence()
+        self.read_cached(builder, sequence=True)
 
         circuit = AnalogCircuit(self.register, self.sequence)
 
@@ -231,10 +309,7 @@ class Parser:
         from bloqade.ir.routine.params import Params
         from bloqade.ir.routine.base import Routine
 
-        self.reset(builder)
-        self.read_register()
-        self.read_sequence()
-        self.read_pragmas()
+        self.read_cached(builder, sequence=True, pragmas=True)
 
         params = Params(
             static_params=self.static_params,
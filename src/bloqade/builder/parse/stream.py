@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional, List, Type
+from typing import Optional, List, Sequence, Type
 from bloqade.builder.base import Builder
 
 
@@ -16,26 +16,38 @@ class BuilderNode:
 class BuilderStream:
     """Represents a stream of builder nodes."""
 
-    head: BuilderNode
-    curr: Optional[BuilderNode] = None
+    nodes: List[BuilderNode]
+    index: int = 0
+
+    @property
+    def head(self) -> Optional[BuilderNode]:
+        return self.nodes[0] if self.nodes else None
+
+    @property
+    def curr(self) -> Optional[BuilderNode]:
+        return self.nodes[self.index] if self.index < len(self.nodes) else None
 
     def copy(self) -> "BuilderStream":
-        return BuilderStream(head=self.head, curr=self.curr)
+        return BuilderStream(nodes=self.nodes, index=self.index)
 
     def read(self) -> Optional[BuilderNode]:
-        if self.curr is None:
+        if self.index >= len(self.nodes):
             return None
 
-        node = self.curr
-        self.curr = self.curr.next
+        node = self.nodes[self.index]
+        self.index += 1
         return node
 
-    def read_next(self, builder_types: List[type[Builder]]) -> Optional[BuilderNode]:
-        node = self.read()
-        while node is not None:
-            if type(node.node) in builder_types:
-                return node
-            node = self.read()
+    def read_next(
+        self, builder_types: Sequence[Type[Builder]]
+    ) -> Optional[BuilderNode]:
+        nodes = self.nodes
+        for index in range(self.index, len(nodes)):
+            if type(nodes[index].node) in builder_types:
+                self.index = index + 1
+                return nodes[index]
+
+        self.index = len(nodes)
         return None
 
     def eat(
@@ -52,13 +64,17 @@ class BuilderStream:
             BuilderNode: The beginning of the stream which matches a type in `types`.
         """
         head = self.read_next(types)
-        curr = head
-        while curr is not None:
-            if type(curr.node) not in types:
-                if skips and type(curr.node) not in skips:
+        if head is None:
+            return head
+
+        nodes = self.nodes
+        index = self.index - 1
+        while index < len(nodes):
+            if type(nodes[index].node) not in types:
+                if skips and type(nodes[index].node) not in skips:
                     break
-            curr = curr.next
-        self.curr = curr
+            index += 1
+        self.index = index
         return head
 
     def __iter__(self):
@@ -84,4 +100,12 @@ class BuilderStream:
     @staticmethod
     def create(builder: Builder) -> "BuilderStream":
         head = BuilderStream.build_nodes(builder)
-        return BuilderStream(head=head, curr=head)
+
+        # keep the nodes in a list so the parser can scan them by index
+        nodes = []
+        curr = head
+        while curr is not None:
+            nodes.append(curr)
+            curr = curr.next
+
+        return BuilderStream(nodes=nodes)
@@ -3,10 +3,11 @@ import bloqade.ir.control.field as field
 import bloqade.ir.control.pulse as pulse
 import bloqade.ir.control.sequence as sequence
 import bloqade.ir.analog_circuit as analog_circuit
+import bloqade.ir.scalar as scalar
 from bloqade.ir.visitor.waveform import WaveformVisitor
 from bloqade.ir.visitor.analog_circuit import AnalogCircuitVisitor
 from decimal import Decimal
-from beartype.typing import Any, Dict
+from beartype.typing import Any, Dict, Tuple
 from beartype import beartype
 from pydantic.dataclasses import dataclass
 
@@ -15,84 +16,212 @@ from pydantic.dataclasses import dataclass
 class IsConstantWaveformResult:
     is_constant: bool
     constant_waveform: waveform.Constant
+    duration: Decimal
+
+
+_ResultCache = Dict[int, Tuple[waveform.Waveform, IsConstantWaveformResult]]
 
 
 class IsConstantWaveform(WaveformVisitor):
     @beartype
     def __init__(self, assignments: Dict[str, Decimal]) -> None:
-        self.assignments = dict(assignments)
+        self._init(dict(assignments), {})
+
+    @classmethod
+    def _from_frozen(
+        cls, assignments: Dict[str, Decimal], results: _ResultCache
+    ) -> "IsConstantWaveform":
+        # skip the copy and type check in `__init__` for assignments that have
+        # already been through it, they are shared but never mutated.
+        visitor = cls.__new__(cls)
+        visitor._init(assignments, results)
+        return visitor
+
+    def _init(self, assignments: Dict[str, Decimal], results: _ResultCache) -> None:
+        self.assignments = assignments
+        # results of the waveforms analyzed so far, shared with the visitors of
+        # sub-waveforms and keyed by `id(ast)`. Entries hold on to their AST so
+        # ids are not reused, the cache goes away with the top-level visitor.
+        self._results = results
         self.is_constant = True
+        # duration and end value of each visited node keyed by `id(node)`, filled
+        # in while visiting so `emit` does not have to walk the AST again.
+        self._duration_cache: Dict[int, Decimal] = {}
+        self._value_cache: Dict[int, Decimal] = {}
+
+    def _duration(self, ast: waveform.Waveform) -> Decimal:
+        key = id(ast)
+        if key not in self._duration_cache:
+            self._duration_cache[key] = ast.duration(**self.assignments)
+
+        return self._duration_cache[key]
+
+    def _value(self, ast: waveform.Waveform) -> Decimal:
+        key = id(ast)
+        if key not in self._value_cache:
+            # some nodes (e.g. `Smooth`) evaluate to floats, convert the same
+            # way `Waveform.__call__` does so values can be combined.
+            self._value_cache[key] = Decimal(
+                str(ast.eval_decimal(self._duration(ast), **self.assignments))
+            )
+
+        return self._value_cache[key]
+
+    def _cache(self, ast: waveform.Waveform, duration: Decimal, value=None) -> None:
+        self._duration_cache[id(ast)] = duration
+        if value is not None:
+            self._value_cache[id(ast)] = value
 
-    def visit_constant(self, _: waveform.Constant) -> Any:
-        pass
+    def visit_constant(self, ast: waveform.Constant) -> Any:
+        self._value(ast)
 
     def visit_linear(self, ast: waveform.Linear) -> Any:
         diff = ast.stop(**self.assignments) - ast.start(**self.assignments)
         self.is_constant = self.is_constant and (diff == 0)
+        self._value(ast)
 
     def visit_poly(self, ast: waveform.Poly) -> Any:
-        coeffs = [coeff(**self.assignments) for coeff in ast.coeffs]
-        if any(coeff != 0 for coeff in coeffs[1:]):
+        # stop evaluating coefficients at the first non-zero one
+        if any(coeff(**self.assignments) != 0 for coeff in ast.coeffs[1:]):
             self.is_constant = False
+        self._value(ast)
 
     def visit_python_fn(self, ast: waveform.PythonFn) -> Any:
         # can't analyze python functions, assume it's not constant
         self.is_constant = False
 
     def visit_append(self, ast: waveform.Append) -> Any:
+        # skip the analysis once the answer is known, the duration and value of
+        # skipped nodes are evaluated on demand by `_duration` and `_value`.
+        if not self.is_constant:
+            return
+
+        is_constant = True
         value = None
         for wf in ast.waveforms:
-            result = IsConstantWaveform(self.assignments).emit(wf)
+            result = self._from_frozen(self.assignments, self._results).emit(wf)
+            wf_value = result.constant_waveform.value(**self.assignments)
+            self._cache(wf, result.duration, wf_value)
             if value is None:
-                value = result.constant_waveform.value
+                value = wf_value
 
-            self.is_constant = (self.is_constant and result.is_constant) and (
-                result.constant_waveform.value == value
-            )
+            is_constant = (is_constant and result.is_constant) and (wf_value == value)
+
+            if not is_constant:
+                break
+
+        self.is_constant = is_constant
 
-            if not self.is_constant:
+        # children skipped above are evaluated on demand by `_duration`
+        durations = list(map(self._duration, ast.waveforms))
+        duration = sum(durations, Decimal(0))
+
+        # `Append.eval_decimal` at the end of the waveform returns the end value
+        # of the first child after which no time is left.
+        append_time = Decimal(0)
+        for wf, wf_duration in zip(ast.waveforms, durations):
+            append_time += wf_duration
+            if append_time >= duration:
+                self._cache(ast, duration, self._value(wf))
                 return
 
+        self._cache(ast, duration, Decimal(0))
+
     def visit_add(self, ast: waveform.Add) -> Any:
-        left_duration = ast.left.duration(**self.assignments)
-        right_duration = ast.right.duration(**self.assignments)
+        if not self.is_constant:
+            return
+
+        self.visit(ast.left)
+        if not self.is_constant:
+            return
+
+        self.visit(ast.right)
+
+        left_duration = self._duration(ast.left)
+        right_duration = self._duration(ast.right)
 
         if left_duration != right_duration:
             self.is_constant = False
+            self._cache(ast, max(left_duration, right_duration))
             return
 
-        self.visit(ast.left)
-        self.visit(ast.right)
+        self._cache(ast, left_duration, self._value(ast.left) + self._value(ast.right))
 
     def visit_alligned(self, ast: waveform.AlignedWaveform) -> Any:
+        if not self.is_constant:
+            return
+
         self.visit(ast.waveform)
+        self._cache(ast, self._duration(ast.waveform), self._value(ast.waveform))
 
     def visit_negative(self, ast: waveform.Negative) -> Any:
+        if not self.is_constant:
+            return
+
         self.visit(ast.waveform)
+        self._cache(ast, self._duration(ast.waveform), -self._value(ast.waveform))
 
     def visit_record(self, ast: waveform.Record) -> Any:
+        if not self.is_constant:
+            return
+
         self.visit(ast.waveform)
+        self._cache(ast, self._duration(ast.waveform), self._value(ast.waveform))
 
     def visit_sample(self, ast: waveform.Sample) -> Any:
+        if not self.is_constant:
+            return
+
         self.visit(ast.waveform)
+        if ast.interpolation is waveform.Interpolation.Linear:
+            self._cache(ast, self._duration(ast.waveform), self._value(ast.waveform))
+        else:
+            # constant interpolation ends on the second to last sample
+            self._cache(ast, self._duration(ast.waveform))
 
     def visit_scale(self, ast: waveform.Scale) -> Any:
+        if not self.is_constant:
+            return
+
         self.visit(ast.waveform)
+        factor = ast.scalar(**self.assignments)
+        self._cache(
+            ast, self._duration(ast.waveform), factor * self._value(ast.waveform)
+        )
 
     def visit_slice(self, ast: waveform.Slice) -> Any:
+        if not self.is_constant:
+            return
+
         self.visit(ast.waveform)
+        # the end value of a slice is not the end value of the sliced waveform,
+        # leave it for `_value` to evaluate if needed.
+        duration = scalar.Slice(scalar.cast(self._duration(ast.waveform)), ast.interval)
+        self._cache(ast, duration(**self.assignments))
 
     def visit_smooth(self, ast: waveform.Smooth) -> Any:
+        if not self.is_constant:
+            return
+
         self.visit(ast.waveform)
+        self._cache(ast, self._duration(ast.waveform))
 
     def emit(self, ast: waveform.Waveform) -> IsConstantWaveformResult:
+        entry = self._results.get(id(ast))
+        if entry is not None:
+            self.is_constant = entry[1].is_constant
+            return entry[1]
+
         self.visit(ast)
-        duration = ast.duration(**self.assignments)
-        value = ast.eval_decimal(duration, **self.assignments)
+        duration = self._duration(ast)
+        value = self._value(ast)
 
         wf = waveform.Constant(value, duration)
 
-        return IsConstantWaveformResult(self.is_constant, wf)
+        result = IsConstantWaveformResult(self.is_constant, wf, duration)
+        self._results[id(ast)] = (ast, result)
+
+        return result
 
 
 @dataclass(frozen=True)
@@ -110,35 +239,45 @@ class IsConstantAnalogCircuit(AnalogCircuitVisitor):
         self.assignments = dict(assignments)
         self.is_constant = True
         self.duration = None
+        # shared by the waveforms of the circuit, see `IsConstantWaveform`
+        self._waveform_results: _ResultCache = {}
 
     def visit_waveform(self, ast: waveform.Waveform):
-        result = IsConstantWaveform(self.assignments).emit(ast)
+        result = IsConstantWaveform._from_frozen(
+            self.assignments, self._waveform_results
+        ).emit(ast)
         self.is_constant = self.is_constant and result.is_constant
         self.waveform = result.constant_waveform
         if self.duration is None:
-            self.duration = self.waveform.duration(**self.assignments)
+            self.duration = result.duration
         else:
-            if self.duration != self.waveform.duration(**self.assignments):
+            if self.duration != result.duration:
                 self.is_constant = False
 
     def visit_field(self, ast: field.Field) -> Any:
-        self.field = field.Field({})
+        drives = {}
         for sm, wf in ast.drives.items():
             self.visit(wf)
+            drives[sm] = self.waveform
 
-            self.field = self.field.add(field.Field({sm: self.waveform}))
+        # merges drives that became the same constant waveform, as `Field.add`
+        self.field = field.Field(drives).canonicalize()
 
     def visit_pulse(self, ast: pulse.Pulse) -> pulse.Pulse:
-        self.pulse = pulse.Pulse({})
+        fields = {}
         for fn, fd in ast.fields.items():
             self.visit(fd)
-            self.pulse.fields[fn] = self.field
+            fields[fn] = self.field
+
+        self.pulse = pulse.Pulse(fields)
 
     def visit_sequence(self, ast: sequence.Sequence) -> sequence.Sequence:
-        self.sequence = sequence.Sequence({})
+        pulses = {}
         for pn, ps in ast.pulses.items():
             self.visit(ps)
-            self.sequence.pulses[pn] = self.pulse
+            pulses[pn] = self.pulse
+
+        self.sequence = sequence.Sequence(pulses)
 
     def visit_analog_circuit(self, ast: analog_circuit.AnalogCircuit) -> Any:
         self.visit(ast.sequence)
@@ -10,14 +10,28 @@ from bloqade.submission.ir.task_results import (
 )
 from bloqade.submission.ir.task_specification import QuEraTaskSpecification
 from braket.aws import AwsDevice, AwsQuantumTask
+from pydantic import PrivateAttr
+from typing import Dict, Optional
 
 
 class BraketBackend(SubmissionBackend):
     device_arn: str = "arn:aws:braket:us-east-1::device/qpu/quera/Aquila"
+    _device: Optional[AwsDevice] = PrivateAttr(None)
+    _quantum_tasks: Dict[str, AwsQuantumTask] = PrivateAttr(default_factory=dict)
 
     @property
     def device(self) -> AwsDevice:
-        return AwsDevice(self.device_arn)
+        if self._device is None:
+            self._device = AwsDevice(self.device_arn)
+
+        return self._device
+
+    def _quantum_task(self, task_id: str) -> AwsQuantumTask:
+        # reuse the task handle (and its boto3 client) when polling a task
+        if task_id not in self._quantum_tasks:
+            self._quantum_tasks[task_id] = AwsQuantumTask(task_id)
+
+        return self._quantum_tasks[task_id]
 
     def submit_task(self, task_ir: QuEraTaskSpecification) -> str:
         shots, ahs_program = to_braket_task(task_ir)
@@ -25,13 +39,13 @@ class BraketBackend(SubmissionBackend):
         return task.id
 
     def task_results(self, task_id: str) -> QuEraTaskResults:
-        return from_braket_task_results(AwsQuantumTask(task_id).result())
+        return from_braket_task_results(self._quantum_task(task_id).result())
 
     def cancel_task(self, task_id: str) -> None:
-        AwsQuantumTask(task_id).cancel()
+        self._quantum_task(task_id).cancel()
 
     def task_status(self, task_id: str) -> QuEraTaskStatusCode:
-        return from_braket_status_codes(AwsQuantumTask(task_id).state())
+        return from_braket_status_codes(self._quantum_task(task_id).state())
 
     def validate_task(self, task_ir: QuEraTaskSpecification):
         pass
@@ -7,9 +7,22 @@ from bloqade.submission.braket import BraketBackend
 
 from bloqade.submission.base import ValidationError
 from bloqade.submission.ir.task_results import QuEraTaskResults, QuEraTaskStatusCode
+import time
 import warnings
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from beartype.typing import Dict, Optional, Any
+from beartype.typing import Dict, Iterable, List, Optional, Tuple, Any
+
+# statuses after which the task can not change anymore
+_TERMINAL_STATUS_CODES = frozenset(
+    [
+        QuEraTaskStatusCode.Completed,
+        QuEraTaskStatusCode.Partial,
+        QuEraTaskStatusCode.Failed,
+        QuEraTaskStatusCode.Unaccepted,
+        QuEraTaskStatusCode.Cancelled,
+    ]
+)
 
 
 ## keep the old conversion for now,
@@ -28,6 +41,12 @@ class BraketTask(RemoteTask):
             task_status=QuEraTaskStatusCode.Unsubmitted
         )
     )
+    _fetch_future: Optional[Future] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _serialized: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def submit(self, force: bool = False) -> "BraketTask":
         if not force:
@@ -54,13 +73,7 @@ class BraketTask(RemoteTask):
         if self.task_result_ir.task_status is QuEraTaskStatusCode.Unsubmitted:
             raise ValueError("Task ID not found.")
 
-        if self.task_result_ir.task_status in [
-            QuEraTaskStatusCode.Completed,
-            QuEraTaskStatusCode.Partial,
-            QuEraTaskStatusCode.Failed,
-            QuEraTaskStatusCode.Unaccepted,
-            QuEraTaskStatusCode.Cancelled,
-        ]:
+        if self._is_terminal():
             return self
 
         status = self.status()
@@ -71,6 +84,18 @@ class BraketTask(RemoteTask):
 
         return self
 
+    def fetch_async(self, executor: Executor) -> "Future[BraketTask]":
+        # non-blocking, run `fetch` on `executor`, reusing the fetch in flight
+        future = self._fetch_future
+        if future is None:
+            future = self._fetch_future = executor.submit(self.fetch)
+            future.add_done_callback(self._fetch_done)
+
+        return future
+
+    def _fetch_done(self, _: Future) -> None:
+        self._fetch_future = None
+
     def pull(self) -> "BraketTask":
         # blocking, force pulling, even its completed
         if self.task_id is None:
@@ -80,16 +105,40 @@ class BraketTask(RemoteTask):
 
         return self
 
+    def wait(
+        self,
+        poll_interval: float = 1.0,
+        backoff: float = 1.5,
+        max_interval: float = 30.0,
+    ) -> "BraketTask":
+        """Block until the task reaches a final status, polling with
+        exponential backoff.
+
+        Args:
+            poll_interval (float, optional): seconds to wait after the first
+                poll. Defaults to 1.0.
+            backoff (float, optional): factor the wait grows by after every
+                poll. Defaults to 1.5.
+            max_interval (float, optional): upper bound on the wait between
+                polls in seconds. Defaults to 30.0.
+
+        Returns:
+            BraketTask: the task itself.
+        """
+        interval = poll_interval
+        while not self.fetch()._is_terminal():
+            time.sleep(interval)
+            interval = min(interval * backoff, max_interval)
+
+        return self
+
     def result(self) -> QuEraTaskResults:
         # blocking, caching
 
         if self.task_result_ir is None:
             pass
         else:
-            if (
-                self.task_id is not None
-                and self.task_result_ir.task_status != QuEraTaskStatusCode.Completed
-            ):
+            if self.task_id is not None and not self._is_terminal():
                 self.pull()
 
         return self.task_result_ir
@@ -98,6 +147,9 @@ class BraketTask(RemoteTask):
         if self.task_id is None:
             return QuEraTaskStatusCode.Unaccepted
 
+        if self._is_terminal():
+            return self.task_result_ir.task_status
+
         return self.backend.task_status(self.task_id)
 
     def cancel(self) -> None:
@@ -118,6 +170,12 @@ class BraketTask(RemoteTask):
             parallel_decoder=self.parallel_decoder,
         )
 
+    def _is_terminal(self) -> bool:
+        return (
+            self.task_result_ir is not None
+            and self.task_result_ir.task_status in _TERMINAL_STATUS_CODES
+        )
+
     def _result_exists(self) -> bool:
         if self.task_result_ir is None:
             return False
@@ -131,9 +189,44 @@ class BraketTask(RemoteTask):
     #    return HardwareTaskShotResults(hardware_task=self)
 
 
+def fetch_all(
+    tasks: Iterable[BraketTask], max_workers: Optional[int] = None
+) -> List[BraketTask]:
+    """Fetch the status and results of `tasks` concurrently.
+
+    Args:
+        tasks (Iterable[BraketTask]): tasks to fetch.
+        max_workers (Optional[int], optional): number of threads used to
+            fetch the tasks. Defaults to the `ThreadPoolExecutor` default.
+
+    Returns:
+        List[BraketTask]: the fetched tasks, in the same order as `tasks`.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [task.fetch_async(executor) for task in tasks]
+        return [future.result() for future in futures]
+
+
 @BraketTask.set_serializer
 def _serialize(obj: BraketTask) -> Dict[str, Any]:
-    return {
+    # `.dict()` copies the whole pydantic model, reuse the previous output as long
+    # as none of the fields have been reassigned since. The models are replaced,
+    # never edited in place, by the task methods. A shallow copy is returned so
+    # callers can update the top-level keys without touching the cached output.
+    fields = (
+        obj.task_id,
+        obj.backend,
+        obj.task_ir,
+        obj.metadata,
+        obj.parallel_decoder,
+        obj.task_result_ir,
+    )
+    if obj._serialized is not None:
+        cached_fields, cached = obj._serialized
+        if all(a is b for a, b in zip(cached_fields, fields)):
+            return dict(cached)
+
+    serialized = {
         "task_id": obj.task_id,
         "backend": obj.backend.dict(),
         "task_ir": obj.task_ir.dict(exclude_none=True, by_alias=True),
@@ -143,10 +236,14 @@ def _serialize(obj: BraketTask) -> Dict[str, Any]:
         else None,
         "task_result_ir": obj.task_result_ir.dict() if obj.task_result_ir else None,
     }
+    obj._serialized = (fields, serialized)
+
+    return dict(serialized)
 
 
 @BraketTask.set_deserializer
 def _deserialize(d: Dict[str, Any]) -> BraketTask:
+    d = dict(d)
     d["backend"] = BraketBackend(**d["backend"])
     d["task_ir"] = QuEraTaskSpecification(**d["task_ir"])
     d["parallel_decoder"] = (
@@ -73,3 +73,14 @@ def test_options_4():
     with pytest.raises(ValueError):
         # checking that using `arg` is not allowed without args
         program._compile(100, args=(2,))
+
+
+def test_duplicate_args():
+    prog = (
+        start.add_position((0, 0))
+        .rydberg.detuning.uniform.constant("x", "y")
+        .args(["x", "y", "x"])
+    )
+
+    with pytest.raises(ValueError, match=r"duplicate names \['x'\]"):
+        prog.parse()
@@ -49,6 +49,15 @@ def test_braket_submit(*args, **kwargs):
     mock_aws_device.run.assert_called_once()
 
 
+@patch("bloqade.submission.braket.AwsDevice")
+def test_braket_device_cached(mock_aws_device):
+    backend = bloqade.submission.braket.BraketBackend()
+
+    assert backend.device is backend.device
+    mock_aws_device.assert_called_once_with(backend.device_arn)
+    assert backend.dict() == {"device_arn": backend.device_arn}
+
+
 @pytest.mark.skip(
     reason="removed implementation for validation because of issue with empty queue."
 )
@@ -133,3 +142,15 @@ def test_braket_status(*args, **kwargs):
     assert backend.task_status("task_id") == QuEraTaskStatusCode.Enqueued
     with pytest.raises(ValueError):
         backend.task_status("task_id")
+
+
+@patch("bloqade.submission.braket.AwsQuantumTask")
+def test_braket_quantum_task_cached(mock_aws_quantum_task):
+    backend = bloqade.submission.braket.BraketBackend()
+    mock_aws_quantum_task.return_value.state.return_value = "RUNNING"
+
+    backend.task_status("task_id")
+    backend.task_status("task_id")
+    backend.cancel_task("task_id")
+
+    mock_aws_quantum_task.assert_called_once_with("task_id")
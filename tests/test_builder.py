@@ -17,6 +17,7 @@ from plum import NotFoundLookupError
 from bloqade.ir.control.waveform import to_waveform
 from bloqade.ir import rydberg, detuning, hyperfine, rabi
 from bloqade import start, cast, var
+from bloqade.atom_arrangement import Chain
 
 # from bloqade.ir.location import Square, Chain
 import numpy as np
@@ -136,6 +137,30 @@ def test_scale():
     assert Loc1.value[ir.Location(1)] == cast(1.2)
 
 
+def test_parse_cache():
+    prog = (
+        start.add_position((0, 0))
+        .rydberg.detuning.uniform.constant("x", 2.0)
+        .assign(x=1)
+    )
+
+    circuit = prog.parse_circuit()
+    assert prog.parse_sequence() is circuit.sequence
+    assert prog.parse().circuit.sequence is circuit.sequence
+    assert prog.parse().params.static_params == {"x": 1}
+
+
+def test_parse_register_atom_arrangement():
+    chain = Chain(2, 6.1)
+    assert chain.parse_register() is chain
+    assert chain.parse_circuit().register is chain
+
+    register = start.add_position((0, 0))
+    assert register.parse_register() is register
+    assert register.parse_sequence() == ir.Sequence({})
+    assert register.parse().circuit.register is register
+
+
 def test_scale_location():
     prog = start.rydberg.detuning.location([1, 2], [1.2, 3.3])
 
@@ -1,5 +1,7 @@
+from decimal import Decimal
 from bloqade.atom_arrangement import Chain
-from bloqade.ir.analysis.is_constant import IsConstantAnalogCircuit
+from bloqade.ir.analysis.is_constant import IsConstantAnalogCircuit, IsConstantWaveform
+from bloqade.ir.control.waveform import Constant, Linear
 
 
 def test_happy_path():
@@ -114,3 +116,46 @@ def test_fail_value():
     # assert False
     result = IsConstantAnalogCircuit().emit(circuit)
     assert not result.is_constant
+
+
+def test_constant_waveform_append():
+    wf = Constant(1.0, 2.0).append(Linear(1.0, 1.0, 3.0)).append(Constant(1.0, 0.5))
+
+    result = IsConstantWaveform({}).emit(wf)
+    assert result.is_constant
+    assert result.constant_waveform == Constant(1.0, 5.5)
+    assert result.duration == Decimal("5.5")
+
+    result = IsConstantWaveform({}).emit(wf.append(-Constant(1.0, 1.0)))
+    assert not result.is_constant
+    assert result.constant_waveform == Constant(-1.0, 6.5)
+
+
+def test_constant_waveform_cache():
+    sub = Constant(1.0, 2.0)
+    wf = sub.append(Constant(1.0, 3.0))
+
+    visitor = IsConstantWaveform({})
+    result = visitor.emit(wf)
+    assert visitor.emit(wf) is result
+    assert visitor._results[id(sub)][0] is sub
+
+    # results are not shared between top-level visitors
+    assert IsConstantWaveform({})._results == {}
+
+
+def test_constant_waveform_short_circuit():
+    wf = Linear(0.0, 1.0, 2.0) + (-Constant(1.0, 2.0))
+
+    result = IsConstantWaveform({}).emit(wf)
+    assert not result.is_constant
+    assert result.duration == Decimal("2.0")
+    assert result.constant_waveform.value() == Decimal("0.0")
+
+
+def test_constant_waveform_add_smooth():
+    wf = Constant(1.0, 2.0) + Constant(1.0, 2.0).smooth(0.1, "Logistic")
+    circuit = Chain(2, 6.1).rydberg.detuning.uniform.apply(wf).parse_circuit()
+
+    result = IsConstantAnalogCircuit().emit(circuit)
+    assert result.is_constant
@@ -1,9 +1,11 @@
 from bloqade.serialize import dumps, loads
 from bloqade import start
 from bloqade.task.quera import QuEraTask
-from bloqade.task.braket import BraketTask
+from bloqade.task.braket import BraketTask, fetch_all
 from bloqade.submission.quera import QuEraBackend
 from bloqade.submission.braket import BraketBackend
+from bloqade.submission.ir.task_results import QuEraTaskResults, QuEraTaskStatusCode
+from unittest.mock import patch
 import pytest
 
 
@@ -37,6 +39,74 @@ def test_braket_task():
         task.pull()
 
 
+@patch("bloqade.submission.braket.AwsQuantumTask")
+def test_braket_task_fetch_all(mock_aws_quantum_task):
+    mock_aws_quantum_task.return_value.state.return_value = "RUNNING"
+
+    backend = BraketBackend()
+    tasks = [
+        BraketTask(
+            task_ir=None,
+            task_id=f"task_{i}",
+            metadata={},
+            backend=backend,
+            task_result_ir=QuEraTaskResults(task_status=QuEraTaskStatusCode.Enqueued),
+        )
+        for i in range(4)
+    ]
+
+    assert fetch_all(tasks) == tasks
+    for task in tasks:
+        assert task.task_result_ir.task_status == QuEraTaskStatusCode.Running
+
+
+@patch("bloqade.task.braket.time.sleep")
+def test_braket_task_wait(mock_sleep):
+    task = BraketTask(
+        task_ir=None,
+        task_id="task_id",
+        metadata={},
+        backend=BraketBackend(),
+        task_result_ir=QuEraTaskResults(task_status=QuEraTaskStatusCode.Enqueued),
+    )
+
+    statuses = [
+        QuEraTaskStatusCode.Enqueued,
+        QuEraTaskStatusCode.Running,
+        QuEraTaskStatusCode.Failed,
+    ]
+    with patch.object(BraketBackend, "task_status", side_effect=statuses) as status:
+        assert task.wait(poll_interval=1.0, backoff=2.0) is task
+        assert status.call_count == 3
+
+        # final status is cached, no more requests
+        assert task.status() == QuEraTaskStatusCode.Failed
+        assert task.result().task_status == QuEraTaskStatusCode.Failed
+        assert status.call_count == 3
+
+    assert [call.args for call in mock_sleep.call_args_list] == [(1.0,), (2.0,)]
+
+
+def test_braket_task_serialize_cache():
+    program = start.add_position((0, 0)).rydberg.detuning.uniform.piecewise_linear(
+        durations=[1.1], values=[0.0, 0.0]
+    )
+    (task,) = program.braket.aquila()._compile(10).tasks.values()
+
+    serialized = task.__bloqade_serializer__(task)
+    assert task.__bloqade_serializer__(task) == serialized
+    assert task.__bloqade_serializer__(task)["task_ir"] is serialized["task_ir"]
+
+    copy = task.__bloqade_deserializer__(task.__bloqade_serializer__(task))
+    assert copy.task_ir == task.task_ir
+    assert loads(dumps(task)).backend == task.backend
+
+    task.task_result_ir = QuEraTaskResults(task_status=QuEraTaskStatusCode.Enqueued)
+    serialized = task.__bloqade_serializer__(task)
+    assert serialized["task_result_ir"]["task_status"] == QuEraTaskStatusCode.Enqueued
+    assert loads(dumps(task)).task_result_ir == task.task_result_ir
+
+
 def test_braket_batch():
     program = (
         start.add_position((0, 0))